@@ -1,14 +1,21 @@
 import argparse
-import hashlib
+import array
+import errno
 import os
 import json
+import queue
+import re
 import shutil
 import sys
+import threading
 import time
 import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime
-from typing import List,Dict,Tuple
+from typing import Callable,Iterator,List,Dict,Optional,Set,TextIO,Tuple
+import xxhash
+import zstandard
 from colorama import init, Fore, Style
 init(autoreset=True) 
 
@@ -23,73 +30,389 @@ File_TYPES: Dict[str,List[str]] = {
     "design": [".psd", ".ai", ".xd", ".fig", ".sketch"],
 }
 
-LOG_NAME = ".organizer_log.json"
+EXT_TO_CAT: Dict[str, str] = {ext: cat for cat, exts in File_TYPES.items() for ext in exts}
+
+LOG_NAME = ".organizer_log.jsonl.zst"
+PLAIN_LOG_NAME = ".organizer_log.jsonl"
+LEGACY_LOG_NAME = ".organizer_log.json"
+LOG_ZSTD_LEVEL = 3
 REPORT_NAME = ".organizer_report.json"
 DUP_DIR = "duplicates"
+HASH_CHUNK = 4 * 1024 * 1024
+PARTIAL_HASH_SIZE = 64 * 1024
+WALK_WORKERS = 8
+PREFETCH_CHUNKS = 2
+STATUS_FLUSH_EVERY = 1000
 
 def humanize(n:int) -> str:
     return f"{n:,}"
 
-def iter_files(root: Path): 
-    for path in root.iterdir():
-        if path.is_dir():
-            yield from iter_files(path)
+
+class StatusLines:
+    """
+    Collects per-file status lines and writes them to stdout in batches,
+    instead of one print (and one colorama conversion) per file.
+    Nothing is collected when quiet.
+    """
+
+    def __init__(self, quiet: bool = False, every: int = STATUS_FLUSH_EVERY):
+        self.quiet = quiet
+        self.every = every
+        self.lines: List[str] = []
+
+    def add(self, line: str):
+        if self.quiet:
+            return
+        self.lines.append(line + Style.RESET_ALL)
+        if len(self.lines) >= self.every:
+            self.flush()
+
+    def flush(self):
+        if self.lines:
+            sys.stdout.write("\n".join(self.lines) + "\n")
+            self.lines.clear()
+
+def iter_files(root: Path, workers: int = WALK_WORKERS) -> Iterator[Tuple[str, Optional[os.stat_result]]]:
+    """
+    Yields (path, stat) for every non-directory entry under root, with stat
+    None if it could not be read. Directories are read by a pool of threads
+    so slow readdir and stat calls overlap; symlinked directories are skipped
+    rather than followed.
+    """
+    dirs: "queue.Queue[Optional[str]]" = queue.Queue()
+    found: "queue.Queue[Optional[List[Tuple[str, Optional[os.stat_result]]]]]" = queue.Queue()
+    lock = threading.Lock()
+    pending = [1]
+
+    def worker():
+        while True:
+            d = dirs.get()
+            if d is None:
+                return
+            batch: List[Tuple[str, Optional[os.stat_result]]] = []
+            try:
+                with os.scandir(d) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            with lock:
+                                pending[0] += 1
+                            dirs.put(entry.path)
+                        elif not entry.is_dir():
+                            try:
+                                st: Optional[os.stat_result] = entry.stat()
+                            except OSError:
+                                st = None
+                            batch.append((entry.path, st))
+            except OSError:
+                pass
+            found.put(batch)
+            with lock:
+                pending[0] -= 1
+                if pending[0] == 0:
+                    found.put(None)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(max(1, workers))]
+    for t in threads:
+        t.start()
+    dirs.put(str(root))
+    try:
+        while True:
+            batch = found.get()
+            if batch is None:
+                break
+            yield from batch
+    finally:
+        for _ in threads:
+            dirs.put(None)
+
+
+def detect_category(name: str) -> str:
+    # Same extension rule as os.path.splitext (leading dots don't count), but
+    # without its overhead; lower() only runs when the exact-case lookup misses.
+    dot = name.rfind(".")
+    if dot <= 0 or (name[0] == "." and not name[:dot].lstrip(".")):
+        return "others"
+    ext = name[dot:]
+    cat = EXT_TO_CAT.get(ext)
+    if cat is None:
+        cat = EXT_TO_CAT.get(ext.lower(), "others")
+    return cat
+
+
+_hash_buffers = threading.local()
+
+
+def file_hash(path: str, chunk: int = HASH_CHUNK) -> int:
+    """
+    Returns a 64-bit xxh3 digest of the file contents.
+    Only used to tell duplicates apart, so a non-cryptographic hash is enough.
+    The file is read with readinto() into a buffer each thread allocates once
+    and reuses, so no bytes object is allocated per chunk or per file; unlike
+    mmap, a file that shrinks while being read just gives a short read
+    instead of a SIGBUS.
+    """
+    h = xxhash.xxh3_64()
+    buf = getattr(_hash_buffers, "buf", None)
+    if buf is None or len(buf) != chunk:
+        buf = _hash_buffers.buf = memoryview(bytearray(chunk))
+    with open(path, "rb", buffering=0) as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(buf[:n])
+    return h.intdigest()
+
+
+def partial_hash(path: str, n: int = PARTIAL_HASH_SIZE) -> int:
+    """
+    Returns the xxh3 digest of the first n bytes of the file.
+    """
+    with open(path, "rb") as f:
+        return xxhash.xxh3_64_intdigest(f.read(n))
+
+
+def prefetch(path: str, length: int):
+    """
+    Asks the kernel to start reading the first length bytes of the file into
+    the page cache in the background. No-op without posix_fadvise.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, length, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def hash_files(
+    paths: List[str],
+    indices: List[int],
+    jobs: int,
+    hasher: Callable[[str], int],
+    status: StatusLines,
+    prefetch_len: int = 0,
+) -> Dict[int, int]:
+    """
+    Hashes paths[i] for each index concurrently, keyed by index; files that
+    can't be read are reported and left out. With a non-zero prefetch_len,
+    each task first asks the kernel to read ahead that many bytes of the file
+    jobs places further down the queue, so its reads are already in flight
+    when a worker gets to it.
+    """
+    hashes: Dict[int, int] = {}
+    pending: "Dict[Future[int], int]" = {}
+    pos = 0
+
+    def task(i: int, ahead: Optional[int]) -> int:
+        if ahead is not None:
+            prefetch(paths[ahead], prefetch_len)
+        return hasher(paths[i])
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        def submit_next() -> bool:
+            nonlocal pos
+            if pos >= len(indices):
+                return False
+            ahead = indices[pos + jobs] if prefetch_len and pos + jobs < len(indices) else None
+            pending[pool.submit(task, indices[pos], ahead)] = indices[pos]
+            pos += 1
+            return True
+
+        for _ in range(2 * jobs):
+            if not submit_next():
+                break
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                i = pending.pop(fut)
+                try:
+                    hashes[i] = fut.result()
+                except Exception as e:
+                    status.add(f"{Fore.YELLOW}⚠️  Skipping (hash error): {os.path.basename(paths[i])} ({e})")
+                submit_next()
+    return hashes
+
+
+def duplicate_hashes(
+    paths: List[str],
+    sizes: "array.array[int]",
+    jobs: int,
+    status: StatusLines,
+    chunk: int = HASH_CHUNK,
+    readahead: bool = False,
+) -> Dict[int, Optional[int]]:
+    """
+    Returns content hashes, keyed by index, for the files that may have a
+    duplicate, narrowing the set first by size and then by a hash of the first
+    PARTIAL_HASH_SIZE bytes. Indices missing from the result are unique; None
+    marks a read error. readahead enables prefetching of upcoming files,
+    capped at PREFETCH_CHUNKS chunks each.
+    """
+    by_size: Dict[int, List[int]] = {}
+    for i, size in enumerate(sizes):
+        by_size.setdefault(size, []).append(i)
+    same_size = [i for group in by_size.values() if len(group) > 1 for i in group]
+
+    prefixes = hash_files(paths, same_size, jobs, partial_hash, status, PARTIAL_HASH_SIZE if readahead else 0)
+    result: Dict[int, Optional[int]] = {i: None for i in same_size if i not in prefixes}
+    by_prefix: Dict[Tuple[int, int], List[int]] = {}
+    for i, prefix in prefixes.items():
+        by_prefix.setdefault((sizes[i], prefix), []).append(i)
+
+    need_full: List[int] = []
+    for (size, _), group in by_prefix.items():
+        if len(group) < 2:
+            continue
+        if size <= PARTIAL_HASH_SIZE:
+            # The prefix already covered the whole file.
+            result.update((i, prefixes[i]) for i in group)
         else:
-            yield path
-
-
-def detect_category(file_path: Path) -> str:
-    ext = file_path.suffix.lower()  # <-- এইটা ঠিক
-    for category, extensions in File_TYPES.items():
-        if ext in extensions:
-            return category
-    return "others"
-
-
-def md5sum(path: Path, chunk: int = 1024*1024) -> str:
-   h = hashlib.md5()
-   with path.open("rb") as f:
-       while True:
-           data = f.read(chunk)
-           if not data:
-               break
-           h.update(data)
-   return h.hexdigest()
-    
+            need_full.extend(group)
+
+    full_prefetch = PREFETCH_CHUNKS * chunk if readahead else 0
+    full = hash_files(paths, need_full, jobs, lambda f: file_hash(f, chunk), status, full_prefetch)
+    result.update((i, full.get(i)) for i in need_full)
+    return result
 
-def date_parts(path: Path) -> Tuple[str, str]:
+
+def mount_fstype(path: Path) -> Optional[str]:
     """
-    Returns (YYYY, MM) using file's creation time if available, else modified time.
+    Returns the filesystem type of the mount holding path, from /proc/self/mounts.
     """
+    real = os.path.realpath(path)
+    best, fstype = "", None
     try:
-        ts = path.stat().st_ctime
-    except Exception:
-        ts = path.stat().st_mtime
-    dt = datetime.fromtimestamp(ts)
-    return dt.strftime("%Y"), dt.strftime("%m")
+        with open("/proc/self/mounts") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                # Mount points escape spaces and other specials as octal.
+                mnt = re.sub(r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), fields[1])
+                inside = real == mnt or real.startswith(mnt.rstrip("/") + "/")
+                if inside and len(mnt) >= len(best):
+                    best, fstype = mnt, fields[2]
+    except OSError:
+        return None
+    return fstype
+
+
+def is_rotational(path: Path) -> Optional[bool]:
+    """
+    Returns whether the disk holding path is a spinning disk, or None if it
+    can't be told. Linux reads the flag from sysfs, checking the parent disk
+    when path sits on a partition; macOS is assumed to be on an SSD.
+    Filesystems without a sysfs block node (btrfs, ZFS, network shares) are
+    unknown, except RAM-backed ones, which have no disk to thrash.
+    """
+    if sys.platform == "darwin":
+        return False
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        dev = os.stat(path).st_dev
+    except OSError:
+        return None
+    if os.major(dev) == 0 and mount_fstype(path) in {"tmpfs", "ramfs"}:
+        return False
+    block = os.path.realpath(f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}")
+    for flag in (os.path.join(block, "queue", "rotational"), os.path.join(block, "..", "queue", "rotational")):
+        try:
+            with open(flag) as f:
+                return f.read().strip() == "1"
+        except OSError:
+            continue
+    return None
+
+
+def detect_jobs(rotational: Optional[bool]) -> Tuple[int, str]:
+    """
+    Picks the hashing worker count from is_rotational(): 1 on spinning disks,
+    where parallel reads make the heads thrash, else one per CPU. Also returns
+    a short description of what was detected.
+    """
+    if rotational is None:
+        return 1, "unknown disk type"
+    if rotational:
+        return 1, "spinning disk"
+    return os.cpu_count() or 1, "SSD"
+
+
+def date_parts(ctime: float) -> Tuple[str, str]:
+    """
+    Returns (YYYY, MM) from an already fetched st_ctime
+    (creation time on Windows, last metadata change elsewhere).
+    """
+    dt = datetime.fromtimestamp(ctime)
+    return f"{dt.year:04d}", f"{dt.month:02d}"
 
 
-def ensure_dir(path: Path, dry: bool):
+def ensure_dir(path: str, dry: bool):
     if dry:
         return
-    path.mkdir(parents=True, exist_ok=True)
+    os.makedirs(path, exist_ok=True)
 
 
-def move_file(src: Path, dst: Path, dry: bool):
-    ensure_dir(dst.parent, dry)
+def rename(src: str, dst: str):
+    """
+    Moves src to dst with a single rename, copying only when they are on
+    different filesystems. dst must not already exist.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
+def move_file(src: str, dst: str, dry: bool, taken: Optional[Dict[str, Set[str]]] = None) -> str:
+    """
+    Moves src to dst, adding " (n)" before the extension when the name is
+    already used, and returns the path the file ended up at. taken caches the
+    names in each destination directory (read once with os.scandir), so
+    picking a free name needs no exists() call per attempt. A name the cache
+    thinks is free is still checked with lexists() before the move, so a
+    stale cache never clobbers anything.
+    """
+    parent, name = os.path.split(dst)
+    ensure_dir(parent, dry)
     if dry:
-        return
-   
-    if dst.exists():
-        stem, suf = dst.stem, dst.suffix
-        i = 1
-        while True:
-            candidate = dst.with_name(f"{stem} ({i}){suf}")
-            if not candidate.exists():
-                dst = candidate
+        return dst
+
+    if taken is None:
+        taken = {}
+    names = taken.get(parent)
+    if names is None:
+        with os.scandir(parent) as it:
+            names = taken[parent] = {entry.name for entry in it}
+
+    stem, suf = os.path.splitext(name)
+    i = 0
+    while True:
+        if name not in names:
+            dst = os.path.join(parent, name)
+            if not os.path.lexists(dst):
                 break
-            i += 1
-    shutil.move(str(src), str(dst))
+            names.add(name)
+        i += 1
+        name = f"{stem} ({i}){suf}"
+    rename(src, dst)
+    names.add(name)
+
+    src_parent, src_name = os.path.split(src)
+    if src_parent in taken:
+        taken[src_parent].discard(src_name)
+    return dst
 
 
 def load_json(path: Path, default):
@@ -101,84 +424,209 @@ def load_json(path: Path, default):
         return default
 
 
-def save_json(path: Path, data):
+def save_report_json(path: Path, data):
     path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
 
 
-def organize(target: Path, by_date: bool, dry_run: bool) -> None:
+_encode_log = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def log_move(log: Optional[TextIO], src: str, dst: str):
+    """
+    Appends one move to the JSON Lines log as it happens and flushes it (a
+    complete zstd block for the compressed log) so a killed run can still be
+    undone. A None log (dry-run) records nothing.
+    """
+    if log is not None:
+        log.write(_encode_log({"src": src, "dst": dst}) + "\n")
+        log.flush()
+
+
+def open_log(path: Path) -> TextIO:
+    """
+    Opens the move log for writing as zstd-compressed JSON Lines.
+    """
+    return zstandard.open(path, "wt", cctx=zstandard.ZstdCompressor(level=LOG_ZSTD_LEVEL), encoding="utf-8")
+
+
+def read_log_lines(f: TextIO) -> List[Dict[str, str]]:
+    # A run that was interrupted can leave a cut-off last line; it is skipped.
+    moves: List[Dict[str, str]] = []
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            moves.append(json.loads(line))
+        except ValueError:
+            continue
+    return moves
+
+
+def load_log(target: Path) -> Tuple[Optional[Path], List[Dict[str, str]]]:
+    """
+    Returns the log file and its moves, falling back to the uncompressed and
+    single-JSON logs written by older versions. (None, []) means there is no
+    log at all.
+    """
+    path = target / LOG_NAME
+    if path.exists():
+        with zstandard.open(path, "rt", encoding="utf-8") as f:
+            return path, read_log_lines(f)
+
+    plain = target / PLAIN_LOG_NAME
+    if plain.exists():
+        with plain.open(encoding="utf-8") as f:
+            return plain, read_log_lines(f)
+
+    legacy = target / LEGACY_LOG_NAME
+    if legacy.exists():
+        return legacy, load_json(legacy, {"moves": []}).get("moves", [])
+    return None, []
+
+
+def make_destination(root: str, ctimes: "array.array[float]", by_date: bool) -> Callable[[int, str, str], str]:
+    """
+    Returns dst(i, category, name) for the file at index i. The by_date check
+    happens once here rather than per file, and the flat variant never looks
+    at ctimes.
+    """
+    join = os.path.join
+
+    if not by_date:
+        def dst(i: int, cat: str, name: str) -> str:
+            return join(root, cat, name)
+        return dst
+
+    def dst_by_date(i: int, cat: str, name: str) -> str:
+        yyyy, mm = date_parts(ctimes[i])
+        return join(root, cat, yyyy, mm, name)
+    return dst_by_date
+
+
+def plan_moves(
+    root: str,
+    paths: List[str],
+    sizes: "array.array[int]",
+    ctimes: "array.array[float]",
+    hashes: Dict[int, Optional[int]],
+    by_date: bool,
+) -> Tuple[List[Tuple[str, str]], Dict[str, int], int]:
+    """
+    Decides where every file goes without touching the filesystem.
+    Returns (moves as (src, dst) pairs, kept files per category, duplicate count).
+    paths must be sorted so the copy of a duplicate that is kept is deterministic.
+    """
+    join, basename = os.path.join, os.path.basename
+    dup_dir = join(root, DUP_DIR)
+    destination = make_destination(root, ctimes, by_date)
+    # Keyed on size too, so a 64-bit digest collision across sizes can't
+    # mark a unique file as a duplicate.
+    seen_hashes: Dict[Tuple[int, int], int] = {}
+    summary: Dict[str, int] = {}
+    moves: List[Tuple[str, str]] = []
+    duplicates = 0
+
+    for i, f in enumerate(paths):
+        name = basename(f)
+
+        if i in hashes:
+            digest = hashes[i]
+            if digest is None:
+                continue
+            key = (sizes[i], digest)
+            if key in seen_hashes:
+                moves.append((f, join(dup_dir, name)))
+                duplicates += 1
+                continue
+            seen_hashes[key] = i
+
+        cat = detect_category(name)
+        summary[cat] = summary.get(cat, 0) + 1
+
+        dst = destination(i, cat, name)
+        if f != dst:
+            moves.append((f, dst))
+
+    return moves, summary, duplicates
+
+
+def organize(
+    target: Path,
+    by_date: bool,
+    dry_run: bool,
+    jobs: Optional[int] = None,
+    chunk: int = HASH_CHUNK,
+    quiet: bool = False,
+) -> None:
     if not target.exists() or not target.is_dir():
         print(f"{Fore.RED}❌ Path not found or not a directory: {target}")
         sys.exit(1)
 
     print(f"{Fore.RED}{Style.BRIGHT}🗂️  Organizing: {target.resolve()}")
+    rotational = is_rotational(target)
+    if jobs is None:
+        jobs, disk = detect_jobs(rotational)
+        print(f"{Fore.CYAN}⚙️  Hashing with {jobs} worker{'s' if jobs != 1 else ''} ({disk}; override with --jobs)")
     if dry_run:
         print(f"{Fore.YELLOW}🔎 Dry-run mode: no files will be moved.\n")
 
+    root = str(target)
     files = list(iter_files(target))
     total = len(files)
     if total == 0:
         print(f"{Fore.MAGENTA}ℹ️  No files found in the target folder.")
         return
 
-    seen_hashes: Dict[str, Path] = {}
-    summary: Dict[str, int] = {}
-    duplicates: List[Dict[str, str]] = []
-    moves_log: List[Dict[str, str]] = []
-
-    dup_dir = target / DUP_DIR
+    dup_dir = os.path.join(root, DUP_DIR)
     ensure_dir(dup_dir, dry_run)
 
     start = time.time()
-
-    for f in files:
-        if f.name in {LOG_NAME, REPORT_NAME} or f.parent == dup_dir or f.name == DUP_DIR:
-            continue
-
-        try:
-            file_hash = md5sum(f)
-        except Exception as e:
-            print(f"{Fore.YELLOW}⚠️  Skipping (hash error): {f.name} ({e})")
+    status = StatusLines(quiet=quiet)
+
+    # Per-file data is kept as parallel arrays indexed like paths.
+    skip_names = {LOG_NAME, PLAIN_LOG_NAME, LEGACY_LOG_NAME, REPORT_NAME, DUP_DIR}
+    paths: List[str] = []
+    sizes = array.array("q")
+    ctimes = array.array("d")
+    for f, st in sorted(files, key=lambda x: x[0]):
+        if os.path.basename(f) in skip_names or os.path.dirname(f) == dup_dir:
             continue
-
-        if file_hash in seen_hashes:
-            dst = dup_dir / f.name
-            move_file(f, dst, dry_run)
-            duplicates.append({"src": str(f), "dst": str(dst)})
-            if not dry_run:
-                moves_log.append({"src": str(f), "dst": str(dst)})
-            # print(f"{Fore.RED}💾 Duplicate moved: {f.name}")
+        if st is None:
+            status.add(f"{Fore.YELLOW}⚠️  Skipping (stat error): {os.path.basename(f)}")
             continue
-        else:
-            seen_hashes[file_hash] = f
+        paths.append(f)
+        sizes.append(st.st_size)
+        ctimes.append(st.st_ctime)
+    del files
 
-        cat = detect_category(f)
-        summary[cat] = summary.get(cat, 0) + 1
-
-        if by_date:
-            yyyy, mm = date_parts(f)
-            dst = target / cat / yyyy / mm / f.name
-        else:
-            dst = target / cat / f.name
+    # Readahead only pays off where extra concurrent reads don't cause seeks.
+    hashes = duplicate_hashes(paths, sizes, max(1, jobs), status, chunk, readahead=rotational is False)
 
-        if f == dst:
-            continue
+    moves, summary, duplicates = plan_moves(root, paths, sizes, ctimes, hashes, by_date)
 
-        move_file(f, dst, dry_run)
-        if not dry_run:
-            moves_log.append({"src": str(f), "dst": str(dst)})
-        # print(f"{Fore.GREEN}✅ Moved: {f.name} → {dst}")
+    log = None if dry_run else open_log(target / LOG_NAME)
+    try:
+        taken: Dict[str, Set[str]] = {}
+        for src, dst in moves:
+            dst = move_file(src, dst, dry_run, taken)
+            log_move(log, src, dst)
+            # status.add(f"{Fore.GREEN}✅ Moved: {os.path.basename(src)} → {dst}")
+    finally:
+        if log is not None:
+            log.close()
+        status.flush()
 
     elapsed = time.time() - start
 
     if not dry_run:
-        save_json(target / LOG_NAME, {"moves": moves_log})
-        save_json(
+        save_report_json(
             target / REPORT_NAME,
             {
                 "target": str(target.resolve()),
                 "summary": summary,
-                "duplicates_moved": len(duplicates),
-                "moves_total": len(moves_log),
+                "duplicates_moved": duplicates,
+                "moves_total": len(moves),
                 "by_date": by_date,
                 "timestamp": datetime.now().isoformat(timespec="seconds"),
                 "elapsed_seconds": round(elapsed, 2),
@@ -189,7 +637,7 @@ def organize(target: Path, by_date: bool, dry_run: bool) -> None:
     print(f"\n{Fore.YELLOW}✅ Organization complete!" if not dry_run else f"\n{Fore.YELLOW}✅ Dry-run summary")
     print(f"   • Scanned files      : {Fore.MAGENTA}{humanize(total)}{Style.RESET_ALL}")
     print(f"   • Organized (kept)   : {Fore.GREEN}{humanize(organized)}{Style.RESET_ALL}")
-    # print(f"   • Duplicates moved   : {Fore.RED}{humanize(len(duplicates))}{Style.RESET_ALL}")
+    # print(f"   • Duplicates moved   : {Fore.RED}{humanize(duplicates)}{Style.RESET_ALL}")
     if summary:
         print("   • Breakdown by category:")
         for cat, n in sorted(summary.items(), key=lambda x: (-x[1], x[0])):
@@ -202,13 +650,11 @@ def organize(target: Path, by_date: bool, dry_run: bool) -> None:
 
 
 def undo_last(target: Path, dry_run: bool) -> None:
-    log_path = target / LOG_NAME
-    if not log_path.exists():
+    log_path, moves = load_log(target)
+    if log_path is None:
         print("ℹ️  No organizer log found. Nothing to undo.")
         return
 
-    data = load_json(log_path, {"moves": []})
-    moves = data.get("moves", [])
     if not moves:
         print("ℹ️  Log is empty. Nothing to undo.")
         return
@@ -223,7 +669,7 @@ def undo_last(target: Path, dry_run: bool) -> None:
             
             continue
 
-        ensure_dir(dst.parent, dry_run)
+        ensure_dir(str(dst.parent), dry_run)
         if dry_run:
             reverted += 1
             continue
@@ -240,15 +686,37 @@ def undo_last(target: Path, dry_run: bool) -> None:
                     break
                 i += 1
 
-        shutil.move(str(src), str(final_dst))
+        rename(str(src), str(final_dst))
         reverted += 1
 
     if not dry_run:
-        save_json(log_path, {"moves": []})
+        log_path.write_text("", encoding="utf-8")
 
     print(f"✅ Undo complete. Files restored (or renamed with .undo): {reverted}")
 
 
+def jobs_arg(value: str) -> Optional[int]:
+    if value == "auto":
+        return None
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"expected 'auto' or a positive number, got {value!r}")
+    return n
+
+
+def hash_chunk_arg(value: str) -> int:
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive number of KiB, got {value!r}")
+    return n
+
+
 def build_parser():
     p = argparse.ArgumentParser(
         description="Organize files into categories, detect duplicates, and generate a summary report."
@@ -259,8 +727,11 @@ def build_parser():
     o.add_argument("--path", required=True, help="Target folder path")
     o.add_argument("--by-date", action="store_true", help="Nest inside YYYY/MM folders")
     o.add_argument("--dry-run", action="store_true", help="Show what would happen without moving files")
+    o.add_argument("--hash-chunk", type=hash_chunk_arg, default=HASH_CHUNK // 1024, metavar="KIB", help="Slice size in KiB fed to the hasher per update (default: 4096)")
+    o.add_argument("--quiet", action="store_true", help="Only print the summary, no per-file messages")
+    o.add_argument("--jobs", type=jobs_arg, default=None, metavar="auto|N", help="Files hashed in parallel (default: auto, 1 on spinning disks, else CPU count)")
 
-    u = sub.add_parser("undo", help="Undo the last organization run (uses .organizer_log.json)")
+    u = sub.add_parser("undo", help=f"Undo the last organization run (uses {LOG_NAME})")
     u.add_argument("--path", required=True, help="Target folder path")
     u.add_argument("--dry-run", action="store_true", help="Preview undo operations without moving files")
 
@@ -274,7 +745,8 @@ def main():
     target = Path(os.path.expanduser(raw_path)).resolve()
 
     if args.command == "organize":
-        organize(target, by_date=args.by_date, dry_run=args.dry_run)
+        chunk = args.hash_chunk * 1024
+        organize(target, by_date=args.by_date, dry_run=args.dry_run, jobs=args.jobs, chunk=chunk, quiet=args.quiet)
     elif args.command == "undo":
         undo_last(target, dry_run=args.dry_run)
     else: